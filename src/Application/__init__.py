@@ -1,31 +1,73 @@
+from datetime import datetime, timedelta
+
+import click
 from flask import Flask
 from commons.configs import Config
-from extensions import db, migrate, jwt
-
-from routes.auth import auth_bp
-from routes.fazendas import fazendas_bp
-from routes.talhoes import talhoes_bp
-from routes.chuva import chuva_bp
-from routes.estacoes import estacoes_bp
+from extensions import db, jwt, limiter
+from utils.startup import StartupTimer
 
 
 def create_app():
-    app = Flask(__name__)
-    app.config.from_object(Config)  
+    """
+    Cria a aplicação. Como `main.py` chama esta função no import, cada processo
+    que sobe sem `--preload` ainda importa routes/models/geoalchemy2/Shapely no
+    boot; o ganho de cold start vem do gunicorn `--preload` (ver `gunicorn.conf.py`),
+    que faz isso uma vez no master e compartilha com os workers via fork.
+    O que de fato fica de fora do boot: Flask-Migrate/Alembic (só no CLI do Flask)
+    e pydantic/email-validator (só na primeira requisição de auth).
+    """
+    timer = StartupTimer()
 
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    timer.mark("config")
 
     db.init_app(app)
-    migrate.init_app(app, db)
     jwt.init_app(app)
+    limiter.init_app(app)
+
+    if click.get_current_context(silent=True) is not None:
+        # Só o CLI precisa do Alembic; gunicorn/app.run não pagam esse import
+        from flask_migrate import Migrate
+        Migrate(app, db)
+    timer.mark("extensions")
+
+    from routes.auth import auth_bp
+    from routes.fazendas import fazendas_bp
+    from routes.talhoes import talhoes_bp
+    from routes.chuva import chuva_bp
+    from routes.estacoes import estacoes_bp
 
     app.register_blueprint(auth_bp, url_prefix="/v.0/auth")
     app.register_blueprint(chuva_bp, url_prefix="/api/chuva_bp")
     app.register_blueprint(estacoes_bp, url_prefix="/v.0/estacoes_bp")
     app.register_blueprint(fazendas_bp, url_prefix="/v.0/fazendas_bp")
     app.register_blueprint(talhoes_bp, url_prefix="/v.0/talhoes_bp")
+    timer.mark("blueprints")
 
     @app.get("/")
     def health():
         return {"status": "ok", "message": "API Pingo Agro rodando!"}, 200
 
-    return app
\ No newline at end of file
+    @app.cli.command("compactar-chuva")
+    @click.option("--dias", type=int, default=None, help="Idade mínima (em dias) das leituras arquivadas")
+    def compactar_chuva(dias):
+        """Move leituras antigas de chuva para o arquivo compactado (rodar via cron)"""
+        from Application.models import DadoChuvaArquivo
+
+        dias = dias if dias is not None else app.config["ARQUIVO_CHUVA_DIAS"]
+        movidas = DadoChuvaArquivo.compactar(datetime.utcnow() - timedelta(days=dias))
+        click.echo(f"{movidas} leituras arquivadas")
+
+    app.extensions["startup"] = timer.report()
+    return app
+
+
+def warmup():
+    """
+    Importa os módulos que as rotas carregam sob demanda (pydantic/email-validator,
+    NumPy). Chamado no master do gunicorn com `--preload` antes do fork, para que
+    os workers compartilhem essas páginas via copy-on-write.
+    """
+    import Application.schemas.auth  # noqa: F401
+    import utils.compactacao  # noqa: F401
@@ -1,10 +1,10 @@
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
+from utils.rate_limit import RateLimiter
 
 
 db = SQLAlchemy()
-migrate = Migrate()
 jwt = JWTManager()
+limiter = RateLimiter()
 
 
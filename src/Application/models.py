@@ -1,9 +1,28 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta, time, timezone
 from geoalchemy2 import Geometry
 from werkzeug.security import generate_password_hash, check_password_hash
 from extensions import db 
 
 
+def normalizar_data(valor):
+    """
+    Converte um limite de período (`date`, `datetime` ou string ISO) em `datetime`
+    ingênuo em UTC, como é gravado em `data_hora`. `date` vira meia-noite do dia.
+    """
+    if valor is None or valor == "":
+        return None
+    
+    if isinstance(valor, str):
+        valor = datetime.fromisoformat(valor)
+    elif not isinstance(valor, datetime) and isinstance(valor, date):
+        valor = datetime.combine(valor, time.min)
+    
+    if valor.tzinfo is not None:
+        valor = valor.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    return valor
+
+
 class BaseModel(db.Model):
     __abstract__ = True
     
@@ -243,6 +262,9 @@ class EstacaoMeteorologica(BaseModel):
     dados_chuva = db.relationship("DadoChuva", backref="estacao", lazy=True,
                                  cascade="all, delete-orphan",
                                  order_by="desc(DadoChuva.data_hora)")
+    arquivos_chuva = db.relationship("DadoChuvaArquivo", backref="estacao", lazy=True,
+                                     cascade="all, delete-orphan",
+                                     order_by="DadoChuvaArquivo.dia")
     
     # Índices
     __table_args__ = (
@@ -320,9 +342,27 @@ class DadoChuva(BaseModel):
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
     
+    @classmethod
+    def from_arquivo(cls, estacao_id, leitura):
+        """
+        Monta uma instância transitória (fora da sessão, nunca persistida) a partir
+        de uma leitura descompactada de `DadoChuvaArquivo`; só serve para leitura.
+        """
+        return cls(estacao_id=estacao_id, **leitura)
+    
+    @staticmethod
+    def _mesclar(dados, arquivados, key):
+        """
+        Junta leituras quentes e arquivadas. Se um `compactar` comitar entre as duas
+        consultas, a mesma leitura aparece nas duas (o arquivo mantém o `id` original).
+        """
+        ids = {d.id for d in dados}
+        return sorted(dados + [a for a in arquivados if a.id not in ids], key=key)
+    
     @classmethod
     def get_by_estacao(cls, estacao_id, start_date=None, end_date=None):
-        """Busca dados de chuva de uma estação com filtro de data"""
+        """Busca dados de chuva de uma estação com filtro de data (inclui dados arquivados)"""
+        start_date, end_date = normalizar_data(start_date), normalizar_data(end_date)
         query = cls.query.filter_by(estacao_id=estacao_id)
         
         if start_date:
@@ -331,14 +371,134 @@ class DadoChuva(BaseModel):
         if end_date:
             query = query.filter(cls.data_hora <= end_date)
         
-        return query.order_by(cls.data_hora).all()
+        dados = query.order_by(cls.data_hora).all()
+        arquivados = DadoChuvaArquivo.get_leituras([estacao_id], start_date, end_date)
+        
+        if not arquivados:
+            return dados
+        return cls._mesclar(dados, arquivados, key=lambda d: d.data_hora)
     
     @classmethod
     def get_by_periodo(cls, start_date, end_date, estacao_ids=None):
-        """Busca dados de chuva por período e estações específicas"""
+        """Busca dados de chuva por período e estações específicas (inclui dados arquivados)"""
+        start_date, end_date = normalizar_data(start_date), normalizar_data(end_date)
         query = cls.query.filter(cls.data_hora.between(start_date, end_date))
         
         if estacao_ids:
             query = query.filter(cls.estacao_id.in_(estacao_ids))
         
-        return query.order_by(cls.estacao_id, cls.data_hora).all()
\ No newline at end of file
+        dados = query.order_by(cls.estacao_id, cls.data_hora).all()
+        arquivados = DadoChuvaArquivo.get_leituras(estacao_ids, start_date, end_date)
+        
+        if not arquivados:
+            return dados
+        return cls._mesclar(dados, arquivados, key=lambda d: (d.estacao_id, d.data_hora))
+
+
+class DadoChuvaArquivo(BaseModel):
+    """
+    Arquivo frio de `DadoChuva`: uma linha por estação por dia, com as leituras
+    compactadas coluna a coluna (ver `utils.compactacao`).
+    """
+    __tablename__ = "dados_chuva_arquivo"
+    
+    estacao_id = db.Column(db.Integer, db.ForeignKey('estacoes_meteorologicas.id'), nullable=False)
+    dia = db.Column(db.Date, nullable=False)
+    quantidade = db.Column(db.Integer, nullable=False)
+    payload = db.Column(db.LargeBinary, nullable=False)
+    
+    # Índices
+    __table_args__ = (
+        db.UniqueConstraint('estacao_id', 'dia', name='uq_dado_chuva_arquivo_estacao_dia'),
+        db.Index('idx_dado_chuva_arquivo_dia', 'dia'),
+    )
+    
+    def get_leituras_dict(self):
+        """Descompacta as leituras do dia"""
+        from utils.compactacao import unpack_leituras
+        return unpack_leituras(self.payload)
+    
+    def set_leituras_dict(self, leituras):
+        """Compacta as leituras do dia (ordenadas por data_hora)"""
+        from utils.compactacao import pack_leituras
+        leituras = sorted(leituras, key=lambda l: l["data_hora"])
+        self.payload = pack_leituras(leituras)
+        self.quantidade = len(leituras)
+    
+    @classmethod
+    def get_leituras(cls, estacao_ids=None, start_date=None, end_date=None):
+        """Busca leituras arquivadas como objetos `DadoChuva` (não persistidos)"""
+        start_date, end_date = normalizar_data(start_date), normalizar_data(end_date)
+        query = cls.query
+        
+        if estacao_ids:
+            query = query.filter(cls.estacao_id.in_(estacao_ids))
+        
+        if start_date:
+            query = query.filter(cls.dia >= start_date.date())
+        
+        if end_date:
+            query = query.filter(cls.dia <= end_date.date())
+        
+        leituras = []
+        for arquivo in query.order_by(cls.estacao_id, cls.dia).all():
+            for leitura in arquivo.get_leituras_dict():
+                if start_date and leitura["data_hora"] < start_date:
+                    continue
+                if end_date and leitura["data_hora"] > end_date:
+                    continue
+                leituras.append(DadoChuva.from_arquivo(arquivo.estacao_id, leitura))
+        
+        return leituras
+    
+    @classmethod
+    def compactar(cls, antes_de):
+        """
+        Move as leituras de `DadoChuva` anteriores a `antes_de` (truncado para o dia)
+        para o arquivo, um commit por estação/dia. Retorna o número de leituras movidas.
+        """
+        limite = datetime.combine(antes_de.date(), time.min)
+        colunas = ("id", "data_hora", "precipitacao_mm", "temperatura", "umidade", "pressao",
+                   "velocidade_vento", "direcao_vento", "fonte", "created_at", "updated_at")
+        movidas = 0
+        
+        estacao_ids = [row[0] for row in db.session.query(DadoChuva.estacao_id)
+                       .filter(DadoChuva.data_hora < limite).distinct().all()]
+        
+        for estacao_id in estacao_ids:
+            while True:
+                primeira = (db.session.query(db.func.min(DadoChuva.data_hora))
+                            .filter(DadoChuva.estacao_id == estacao_id, DadoChuva.data_hora < limite)
+                            .scalar())
+                if primeira is None:
+                    break
+                
+                inicio = datetime.combine(primeira.date(), time.min)
+                dados = (DadoChuva.query
+                         .filter(DadoChuva.estacao_id == estacao_id,
+                                 DadoChuva.data_hora >= inicio,
+                                 DadoChuva.data_hora < inicio + timedelta(days=1))
+                         .all())
+                
+                try:
+                    arquivo = cls.query.filter_by(estacao_id=estacao_id, dia=inicio.date()).first()
+                    leituras = [{c: getattr(d, c) for c in colunas} for d in dados]
+                    if arquivo:
+                        # Leituras atrasadas para um dia já arquivado
+                        leituras = arquivo.get_leituras_dict() + leituras
+                    else:
+                        arquivo = cls(estacao_id=estacao_id, dia=inicio.date())
+                    arquivo.set_leituras_dict(leituras)
+                    
+                    db.session.add(arquivo)
+                    DadoChuva.query.filter(DadoChuva.id.in_([d.id for d in dados])) \
+                        .delete(synchronize_session=False)
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    raise e
+                
+                db.session.expunge_all()
+                movidas += len(dados)
+        
+        return movidas
@@ -1,7 +1,6 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from Application.models import Produtor, db
-from Application.schemas.auth import RegisterSchema, LoginSchema, TokenResponse
 from datetime import timedelta
 
 
@@ -10,6 +9,9 @@ auth_bp = Blueprint('auth', __name__, url_prefix='/v.0/auth')
 
 @auth_bp.route('/register', methods=['POST'])
 def register():
+    # pydantic/email-validator carregados só no primeiro uso (ver Application.warmup)
+    from Application.schemas.auth import RegisterSchema, TokenResponse
+
     try:
         data = RegisterSchema(**request.get_json())
     except Exception as e:
@@ -38,6 +40,8 @@ def register():
 
 @auth_bp.route('/login', methods=['POST'])
 def login():
+    from Application.schemas.auth import LoginSchema, TokenResponse
+
     try:
         data = LoginSchema(**request.get_json())
     except Exception as e:
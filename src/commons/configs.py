@@ -8,7 +8,25 @@ class Config:
     SECRET_KEY = config("SECRET_KEY")
     JWT_SECRET_KEY = config("JWT_SECRET_KEY")
     DATABASE_URL = config("DATABASE_URL")
+    SQLALCHEMY_DATABASE_URI = DATABASE_URL
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    LOG_FOLDER = config("LOG_FOLDER", default=os.path.join(ROOT, "logs"))
 
+    # Rate limiting (token bucket) por estação no ingest e por usuário nas rotas /v.0
+    RATE_LIMIT_ENABLED = config("RATE_LIMIT_ENABLED", default=True, cast=bool)
+    RATE_LIMIT_SHARDS = config("RATE_LIMIT_SHARDS", default=16, cast=int)
+    RATE_LIMIT_INGEST_RATE = config("RATE_LIMIT_INGEST_RATE", default=1.0, cast=float)      # tokens/s
+    RATE_LIMIT_INGEST_BURST = config("RATE_LIMIT_INGEST_BURST", default=10, cast=int)
+    RATE_LIMIT_USER_RATE = config("RATE_LIMIT_USER_RATE", default=5.0, cast=float)          # tokens/s
+    RATE_LIMIT_USER_BURST = config("RATE_LIMIT_USER_BURST", default=20, cast=int)
+
+    # Load shedding: descarta ingest antes de tocar no banco quando a espera na fila
+    # (header carimbado pelo proxy na chegada, ex.: nginx `X-Request-Start: t=${msec}`) passa do limite
+    LOAD_SHED_ENABLED = config("LOAD_SHED_ENABLED", default=True, cast=bool)
+    LOAD_SHED_HEADER = config("LOAD_SHED_HEADER", default="X-Request-Start")
+    LOAD_SHED_QUEUE_WAIT_MS = config("LOAD_SHED_QUEUE_WAIT_MS", default=500, cast=float)  # média móvel, ms
+
+    # Arquivo compactado de leituras frias: DadoChuva mais antigo que isso vai para DadoChuvaArquivo
+    ARQUIVO_CHUVA_DIAS = config("ARQUIVO_CHUVA_DIAS", default=90, cast=int)
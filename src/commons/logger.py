@@ -1,6 +1,6 @@
-from loguru import logger
-from commons import config
-import psutil
+from loguru import logger as _logger
+from commons.configs import Config
+import threading
 import json
 import os
 from datetime import datetime
@@ -8,6 +8,8 @@ import sys
 
 
 def serialize(record):
+    import psutil
+
     log = {
         "timestamp": f"""{record['time'].strftime("%Y-%m-%d %H:%M:%S")}""",
         "level": f"{record['level']}",
@@ -34,20 +36,44 @@ def formatter(record):
     return "{extra[serialized]}\n"
 
 
-logger.remove()
-# logger.add(
-#     os.path.join(
-#         config.LOG_FOLDER,
-#         f"""{datetime.strftime(datetime.now(),"%m-%d-%Y-%H-%M-%S")}.json""",
-#     ),
-#     format=formatter,
-# )
-logger.add(
-    os.path.join(
-        config.LOG_FOLDER,
-        f"""{datetime.strftime(datetime.now(),"%m-%d-%Y-%H-%M-%S")}.log""",
-    ),
-    rotation="1 day",
-)
-logger.add(sys.stdout, colorize=True)
-logger.info("Logging to file")
+class _LazyLogger:
+    """
+    Proxy do logger do loguru que só cria os sinks (arquivo de log, stdout)
+    na primeira chamada, em vez de no import do módulo.
+    """
+
+    def __init__(self):
+        self._configured = False
+        self._lock = threading.Lock()
+
+    def _setup(self):
+        with self._lock:
+            if self._configured:
+                return
+
+            _logger.remove()
+            # _logger.add(
+            #     os.path.join(
+            #         Config.LOG_FOLDER,
+            #         f"""{datetime.strftime(datetime.now(),"%m-%d-%Y-%H-%M-%S")}.json""",
+            #     ),
+            #     format=formatter,
+            # )
+            _logger.add(
+                os.path.join(
+                    Config.LOG_FOLDER,
+                    f"""{datetime.strftime(datetime.now(),"%m-%d-%Y-%H-%M-%S")}.log""",
+                ),
+                rotation="1 day",
+            )
+            _logger.add(sys.stdout, colorize=True)
+            self._configured = True
+            _logger.info("Logging to file")
+
+    def __getattr__(self, name):
+        if not self._configured:
+            self._setup()
+        return getattr(_logger, name)
+
+
+logger = _LazyLogger()
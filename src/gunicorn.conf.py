@@ -0,0 +1,37 @@
+"""
+Configuração do gunicorn: `gunicorn -c gunicorn.conf.py main:app` (a partir de `src/`).
+
+Com `preload_app` a aplicação é criada uma vez no master e os workers a herdam
+via fork (copy-on-write), em vez de cada worker importar tudo de novo.
+"""
+import gc
+
+from decouple import config
+
+bind = config("GUNICORN_BIND", default="0.0.0.0:8000")
+workers = config("GUNICORN_WORKERS", default=2, cast=int)
+preload_app = config("GUNICORN_PRELOAD", default=True, cast=bool)
+
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+
+    from Application import warmup
+
+    # Carrega no master o que as rotas importam sob demanda e congela os objetos
+    # já criados, para o GC dos workers não tocar (e copiar) essas páginas
+    warmup()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    if not server.cfg.preload_app:
+        return
+
+    from main import app
+    from extensions import db
+
+    # Conexões abertas no master não podem ser compartilhadas entre processos
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Mesmo layout de import da aplicação: `Application.*` e os módulos soltos (`extensions`, `routes`)
+sys.path[:0] = [SRC, os.path.join(SRC, "Application")]
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("JWT_SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+
+@pytest.fixture
+def app():
+    """App mínimo com SQLite em memória e só as tabelas de chuva (sem PostGIS)"""
+    from flask import Flask
+    from extensions import db
+    from Application.models import DadoChuva, DadoChuvaArquivo
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+
+    with app.app_context():
+        db.metadata.create_all(db.engine, tables=[DadoChuva.__table__, DadoChuvaArquivo.__table__])
+        yield app
+        db.session.remove()
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+from extensions import db
+from Application.models import DadoChuva, DadoChuvaArquivo
+
+BASE = datetime(2023, 1, 1)
+
+
+def criar_leituras(estacao_id, inicio, quantidade, passo=timedelta(minutes=30)):
+    for i in range(quantidade):
+        db.session.add(DadoChuva(
+            estacao_id=estacao_id,
+            data_hora=inicio + i * passo,
+            precipitacao_mm=i / 10,
+            temperatura=None if i % 2 else 21.0,
+        ))
+    db.session.commit()
+
+
+def test_compactar_preserva_leituras(app):
+    criar_leituras(1, BASE, 96)
+    antes = [d.to_dict() for d in DadoChuva.get_by_estacao(1)]
+
+    movidas = DadoChuvaArquivo.compactar(BASE + timedelta(days=2))
+
+    assert movidas == 96
+    assert DadoChuva.query.count() == 0
+    assert DadoChuvaArquivo.query.count() == 2
+    assert [d.to_dict() for d in DadoChuva.get_by_estacao(1)] == antes
+
+
+def test_leitura_atrasada_e_mesclada_no_dia_ja_arquivado(app):
+    criar_leituras(1, BASE, 48)
+    DadoChuvaArquivo.compactar(BASE + timedelta(days=1))
+
+    criar_leituras(1, BASE + timedelta(hours=5, minutes=1), 1)
+    movidas = DadoChuvaArquivo.compactar(BASE + timedelta(days=1))
+
+    assert movidas == 1
+    arquivo = DadoChuvaArquivo.query.filter_by(estacao_id=1, dia=BASE.date()).one()
+    leituras = arquivo.get_leituras_dict()
+    assert arquivo.quantidade == len(leituras) == 49
+    assert [l["data_hora"] for l in leituras] == sorted(l["data_hora"] for l in leituras)
+    assert BASE + timedelta(hours=5, minutes=1) in [l["data_hora"] for l in leituras]
+
+
+def test_leitura_quente_e_arquivada_aparece_uma_vez(app):
+    criar_leituras(1, BASE, 48)
+    quente = DadoChuva.query.order_by(DadoChuva.data_hora).first().to_dict()
+    DadoChuvaArquivo.compactar(BASE + timedelta(days=1))
+
+    # Simula um `compactar` comitando entre a leitura quente e a do arquivo
+    db.session.add(DadoChuva(
+        id=quente["id"],
+        estacao_id=1,
+        data_hora=BASE,
+        precipitacao_mm=quente["precipitacao_mm"],
+    ))
+    db.session.commit()
+
+    dados = DadoChuva.get_by_estacao(1)
+    periodo = DadoChuva.get_by_periodo(BASE, BASE + timedelta(days=1), [1])
+
+    assert len(dados) == len(periodo) == 48
+    assert len({d.id for d in dados}) == 48
+    assert [d.id for d in periodo].count(quente["id"]) == 1
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+from utils.compactacao import pack_leituras, unpack_leituras
+
+
+def leitura(i, base=datetime(2023, 1, 1), **campos):
+    dado = {
+        "id": 100 + i,
+        "data_hora": base + timedelta(minutes=i, microseconds=7 * i),
+        "precipitacao_mm": 0.1 * i,
+        "temperatura": 21.5,
+        "umidade": 55.0,
+        "pressao": 1013.2,
+        "velocidade_vento": 3.4,
+        "direcao_vento": 270.0,
+        "fonte": "estacao_propria",
+        "created_at": base + timedelta(minutes=i, seconds=2),
+        "updated_at": base + timedelta(minutes=i, seconds=2),
+    }
+    dado.update(campos)
+    return dado
+
+
+def test_round_trip_preserva_nulos():
+    leituras = [
+        leitura(0, temperatura=None, umidade=None, pressao=None,
+                velocidade_vento=None, direcao_vento=None),
+        leitura(1, fonte=None, created_at=None, updated_at=None),
+        leitura(2, precipitacao_mm=0.0),
+    ]
+
+    assert unpack_leituras(pack_leituras(leituras)) == leituras
+
+
+def test_round_trip_lista_vazia():
+    assert unpack_leituras(pack_leituras([])) == []
+
+
+def test_round_trip_distingue_fonte_vazia_de_nula():
+    leituras = [leitura(0, fonte=""), leitura(1, fonte=None)]
+
+    resultado = unpack_leituras(pack_leituras(leituras))
+
+    assert resultado == leituras
+    assert resultado[0]["fonte"] == ""
+    assert resultado[1]["fonte"] is None
+
+
+def test_round_trip_timestamps_anteriores_a_1970():
+    leituras = [leitura(i, base=datetime(1965, 12, 31, 23, 30)) for i in range(60)]
+
+    assert unpack_leituras(pack_leituras(leituras)) == leituras
+
+
+def test_round_trip_dia_completo():
+    leituras = [leitura(i, temperatura=None if i % 7 == 0 else 20.0 + i / 100) for i in range(1440)]
+
+    assert unpack_leituras(pack_leituras(leituras)) == leituras
@@ -0,0 +1,115 @@
+"""
+Codec do arquivo compactado de leituras de chuva (uma linha por estação/dia).
+
+As leituras são guardadas coluna a coluna em arrays NumPy: timestamps e ids
+em delta, floats como float64 com máscara de nulos, tudo comprimido com zlib.
+A conversão é sem perdas: `unpack_leituras(pack_leituras(x)) == x`.
+"""
+import io
+import zlib
+from datetime import datetime, timedelta
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+FLOAT_COLUMNS = (
+    "precipitacao_mm",
+    "temperatura",
+    "umidade",
+    "pressao",
+    "velocidade_vento",
+    "direcao_vento",
+)
+
+
+def _to_us(dt):
+    return (dt - EPOCH) // MICROSECOND
+
+
+def _from_us(us):
+    return EPOCH + timedelta(microseconds=int(us))
+
+
+def _delta(values):
+    values = np.asarray(values, dtype=np.int64)
+    return np.diff(values, prepend=np.int64(0))
+
+
+def _undelta(deltas):
+    return np.cumsum(deltas, dtype=np.int64)
+
+
+def _nulls(values):
+    return np.packbits(np.array([v is None for v in values], dtype=bool))
+
+
+def pack_leituras(leituras):
+    """
+    Serializa uma lista de dicts de leitura (chaves de `DadoChuva`) em bytes.
+    As leituras devem estar ordenadas por `data_hora`.
+    """
+    data_hora = [_to_us(l["data_hora"]) for l in leituras]
+    arrays = {
+        "version": np.array([FORMAT_VERSION], dtype=np.int64),
+        "id": _delta([l.get("id") or 0 for l in leituras]),
+        "data_hora": _delta(data_hora),
+    }
+
+    # created_at/updated_at como offset em relação a data_hora (quase constante, comprime bem)
+    for name in ("created_at", "updated_at"):
+        values = [l.get(name) for l in leituras]
+        arrays[name] = np.array(
+            [_to_us(v) - ts if v is not None else 0 for v, ts in zip(values, data_hora)],
+            dtype=np.int64,
+        )
+        arrays[name + "_null"] = _nulls(values)
+
+    for name in FLOAT_COLUMNS:
+        values = [l.get(name) for l in leituras]
+        arrays[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        arrays[name + "_null"] = _nulls(values)
+
+    fontes = [l.get("fonte") for l in leituras]
+    arrays["fonte"] = np.array([f or "" for f in fontes], dtype=str)
+    arrays["fonte_null"] = _nulls(fontes)
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return zlib.compress(buffer.getvalue(), 6)
+
+
+def unpack_leituras(payload):
+    """Inverso de `pack_leituras`: devolve a lista de dicts de leitura"""
+    with np.load(io.BytesIO(zlib.decompress(payload)), allow_pickle=False) as arrays:
+        version = int(arrays["version"][0])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Versão de arquivo de chuva não suportada: {version}")
+
+        ids = _undelta(arrays["id"])
+        data_hora = _undelta(arrays["data_hora"])
+        count = len(data_hora)
+
+        def nulls(name):
+            return np.unpackbits(arrays[name + "_null"], count=count).astype(bool)
+
+        columns = {"id": [int(i) or None for i in ids]}
+        columns["data_hora"] = [_from_us(ts) for ts in data_hora]
+
+        for name in ("created_at", "updated_at"):
+            offsets, null = arrays[name], nulls(name)
+            columns[name] = [
+                None if null[i] else _from_us(data_hora[i] + offsets[i]) for i in range(count)
+            ]
+
+        for name in FLOAT_COLUMNS:
+            values, null = arrays[name], nulls(name)
+            columns[name] = [None if null[i] else float(values[i]) for i in range(count)]
+
+        fontes, null = arrays["fonte"], nulls("fonte")
+        columns["fonte"] = [None if null[i] else str(fontes[i]) for i in range(count)]
+
+    return [{name: values[i] for name, values in columns.items()} for i in range(count)]
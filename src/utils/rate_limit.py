@@ -0,0 +1,188 @@
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, request, jsonify
+from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
+
+
+class TokenBucket:
+    """Balde de tokens simples: `rate` tokens por segundo, até `burst` acumulados"""
+
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, burst, now):
+        self.tokens = float(burst)
+        self.updated_at = now
+
+    def consume(self, rate, burst, now):
+        """Tenta consumir um token; retorna os segundos de espera (0 se liberado)"""
+        self.tokens = min(burst, self.tokens + (now - self.updated_at) * rate)
+        self.updated_at = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+
+        return (1 - self.tokens) / rate if rate > 0 else 1
+
+
+class ShardedBuckets:
+    """
+    Conjunto de baldes particionado em shards, cada um com seu próprio lock,
+    para que estações/usuários diferentes não disputem o mesmo lock.
+    """
+
+    def __init__(self, rate, burst, shards=16, max_keys_per_shard=4096):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.max_keys_per_shard = max(1, max_keys_per_shard)
+        self._shards = [(OrderedDict(), threading.Lock()) for _ in range(max(1, shards))]
+
+    def hit(self, key):
+        """Registra uma requisição para `key`; retorna os segundos de espera (0 se liberado)"""
+        buckets, lock = self._shards[hash(key) % len(self._shards)]
+        now = time.monotonic()
+
+        with lock:
+            bucket = buckets.get(key)
+            if bucket is None:
+                # Limite rígido por shard: descarta o balde usado há mais tempo (LRU)
+                if len(buckets) >= self.max_keys_per_shard:
+                    buckets.popitem(last=False)
+                bucket = buckets[key] = TokenBucket(self.burst, now)
+            else:
+                buckets.move_to_end(key)
+            return bucket.consume(self.rate, self.burst, now)
+
+
+class _RateLimitState:
+    """Estado por aplicação (baldes e média de espera na fila), em `app.extensions`"""
+
+    def __init__(self, config):
+        shards = config.get("RATE_LIMIT_SHARDS", 16)
+        self.ingest_buckets = ShardedBuckets(
+            config.get("RATE_LIMIT_INGEST_RATE", 1.0),
+            config.get("RATE_LIMIT_INGEST_BURST", 10),
+            shards,
+        )
+        self.user_buckets = ShardedBuckets(
+            config.get("RATE_LIMIT_USER_RATE", 5.0),
+            config.get("RATE_LIMIT_USER_BURST", 20),
+            shards,
+        )
+        self.queue_wait_ms = 0.0
+        self.queue_wait_lock = threading.Lock()
+        self.queue_header_seen = False
+        self.queue_header_warned = False
+
+    def record_queue_wait(self, wait_ms, alpha):
+        with self.queue_wait_lock:
+            self.queue_wait_ms += alpha * (wait_ms - self.queue_wait_ms)
+
+
+class RateLimiter:
+    """
+    Limita requisições por estação (`X-Station-UUID` no ingest) e por usuário
+    (identidade do JWT nas rotas `/v.0`), e descarta ingest quando o
+    servidor está sobrecarregado — tudo antes de qualquer acesso ao banco.
+
+    Sobrecarga = média móvel do tempo que as requisições esperaram na fila
+    antes de um worker pegá-las, medida pelo header que o proxy carimba na
+    chegada (`X-Request-Start`, ex.: nginx `t=${msec}`). Sem o header não há
+    sinal e nada é descartado.
+    """
+
+    INGEST_ENDPOINT = "chuva.ingest"
+    QUEUE_WAIT_ALPHA = 0.2
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["rate_limiter"] = _RateLimitState(app.config)
+        app.before_request(self._before_request)
+
+    @staticmethod
+    def _state():
+        return current_app.extensions["rate_limiter"]
+
+    def _before_request(self):
+        config = current_app.config
+        state = self._state()
+
+        if config.get("LOAD_SHED_ENABLED", True):
+            # Toda requisição (dashboard inclusive) alimenta o sinal de fila
+            header = config.get("LOAD_SHED_HEADER", "X-Request-Start")
+            wait_ms = parse_request_start(request.headers.get(header))
+            if wait_ms is not None:
+                state.queue_header_seen = True
+                state.record_queue_wait(wait_ms, self.QUEUE_WAIT_ALPHA)
+            elif not state.queue_header_seen and not state.queue_header_warned:
+                state.queue_header_warned = True
+                current_app.logger.warning(
+                    "LOAD_SHED_ENABLED, mas a requisição chegou sem o header %s: "
+                    "o proxy precisa carimbá-lo (ex.: nginx `proxy_set_header %s \"t=${msec}\";`), "
+                    "senão o ingest nunca é descartado por sobrecarga",
+                    header, header,
+                )
+
+        if request.endpoint == self.INGEST_ENDPOINT:
+            if config.get("LOAD_SHED_ENABLED", True) and self.overloaded():
+                return jsonify({"erro": "Servidor sobrecarregado, tente novamente"}), 503, {"Retry-After": "1"}
+
+            station_uuid = request.headers.get("X-Station-UUID")
+            if config.get("RATE_LIMIT_ENABLED", True) and station_uuid:
+                response = self._limit(state.ingest_buckets, station_uuid)
+                if response is not None:
+                    return response
+
+            return None
+
+        if config.get("RATE_LIMIT_ENABLED", True) and request.path.startswith("/v.0"):
+            try:
+                verify_jwt_in_request(optional=True)
+                identity = get_jwt_identity()
+            except Exception:
+                # Token inválido: a própria rota devolve o erro adequado
+                identity = None
+
+            if identity is not None:
+                return self._limit(state.user_buckets, str(identity))
+
+        return None
+
+    def _limit(self, buckets, key):
+        wait = buckets.hit(key)
+        if not wait:
+            return None
+        retry_after = str(max(1, int(wait + 0.999)))
+        return jsonify({"erro": "Limite de requisições excedido"}), 429, {"Retry-After": retry_after}
+
+    def overloaded(self):
+        """Indica se o ingest do app atual deve ser descartado (espera média na fila acima do limite)"""
+        return self._state().queue_wait_ms >= current_app.config.get("LOAD_SHED_QUEUE_WAIT_MS", 500)
+
+
+def parse_request_start(header, now=None):
+    """
+    Converte um header `X-Request-Start` (`t=<epoch>` ou `<epoch>`, em s, ms ou µs)
+    em milissegundos de espera até agora; None se ausente ou inválido.
+    """
+    if not header:
+        return None
+
+    try:
+        start = float(header.strip().removeprefix("t="))
+    except ValueError:
+        return None
+
+    # Deduz a unidade pela ordem de grandeza do epoch
+    if start > 1e14:
+        start /= 1e6
+    elif start > 1e11:
+        start /= 1e3
+
+    now = time.time() if now is None else now
+    return max(0.0, (now - start) * 1000)
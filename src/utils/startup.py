@@ -0,0 +1,113 @@
+"""
+Relatório de tempo de inicialização (cold start).
+
+Uso, a partir de `src/`:
+    python -m utils.startup            # tabela legível
+    python -m utils.startup --json     # para guardar/comparar entre releases
+
+Roda `python -X importtime -c "from main import app"` num processo novo,
+agrupa o tempo de import por pacote de topo e junta as fases de `create_app`.
+"""
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = (
+    "import json, time, sys\n"
+    "inicio = time.perf_counter()\n"
+    "from main import app\n"
+    "total = time.perf_counter() - inicio\n"
+    "sys.stdout.write(json.dumps({'total_ms': total * 1000, 'fases': app.extensions.get('startup', {})}))\n"
+)
+
+
+class StartupTimer:
+    """Marca o tempo (ms) de cada fase de `create_app`"""
+
+    def __init__(self):
+        self._inicio = self._ultimo = time.perf_counter()
+        self._fases = {}
+
+    def mark(self, fase):
+        agora = time.perf_counter()
+        self._fases[fase] = round((agora - self._ultimo) * 1000, 2)
+        self._ultimo = agora
+
+    def report(self):
+        fases = dict(self._fases)
+        fases["create_app"] = round((self._ultimo - self._inicio) * 1000, 2)
+        return fases
+
+
+def parse_importtime(stderr):
+    """
+    Converte a saída de `-X importtime` em {pacote de topo: (self_ms, cumulativo_ms)}.
+    `self_ms` soma todos os submódulos do pacote; `cumulativo_ms` é o tempo do
+    import do próprio pacote, incluindo as dependências que ele puxou.
+    """
+    pacotes = defaultdict(lambda: [0.0, 0.0])
+
+    for linha in stderr.splitlines():
+        if not linha.startswith("import time:") or "[us]" in linha:
+            continue
+
+        self_us, cumulativo_us, nome = linha[len("import time:"):].split("|", 2)
+        nome = nome.strip()
+        topo = nome.split(".")[0]
+        pacotes[topo][0] += int(self_us) / 1000
+
+        if nome == topo:
+            pacotes[topo][1] = max(pacotes[topo][1], int(cumulativo_us) / 1000)
+
+    return {nome: (round(s, 2), round(c, 2)) for nome, (s, c) in pacotes.items()}
+
+
+def run(env=None):
+    """Mede o cold start de `main.app` num interpretador novo"""
+    import subprocess
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=SRC,
+        env=env or os.environ.copy(),
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Falha ao iniciar a aplicação:\n{proc.stderr[-2000:]}")
+
+    resultado = json.loads(proc.stdout.strip().splitlines()[-1])
+    resultado["imports"] = parse_importtime(proc.stderr)
+    return resultado
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Relatório de tempo de inicialização da API")
+    parser.add_argument("--json", action="store_true", help="Saída em JSON")
+    parser.add_argument("--top", type=int, default=20, help="Quantidade de pacotes listados")
+    args = parser.parse_args(argv)
+
+    resultado = run()
+
+    if args.json:
+        print(json.dumps(resultado, indent=2))
+        return
+
+    print(f"Import de main.app: {resultado['total_ms']:.1f} ms")
+    for fase, ms in resultado["fases"].items():
+        print(f"  {fase:<12} {ms:>9.1f} ms")
+
+    print(f"\n{'pacote':<28} {'self ms':>10} {'cumul. ms':>10}")
+    ordenados = sorted(resultado["imports"].items(), key=lambda item: item[1][1], reverse=True)
+    for nome, (self_ms, cumulativo_ms) in ordenados[:args.top]:
+        print(f"{nome:<28} {self_ms:>10.1f} {cumulativo_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()